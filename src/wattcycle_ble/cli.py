@@ -4,54 +4,128 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+import functools
+import itertools
 import logging
 import sys
+from collections.abc import Coroutine
+from typing import Any
 
 from .client import WattcycleClient
-from .models import AnalogQuantity
+from .models import AnalogQuantity, ProductInfo, WarningInfo
+
+
+_CELL_VOLTAGE_FMT = "    Cell {:2d}: {:.3f} V".format
+_CELL_TEMPERATURE_FMT = "    Cell {}: {:.1f} C".format
 
 
 def print_battery_data(aq: AnalogQuantity) -> None:
     """Pretty-print battery data to stdout."""
-    print()
-    print("=" * 60)
-    print("  BATTERY STATUS")
-    print("=" * 60)
-
-    print(f"\n  SOC:                {aq.soc}%")
-    print(f"  Current:            {aq.current:.1f} A")
-    print(f"  Module Voltage:     {aq.module_voltage:.2f} V")
-    print(f"  Remaining Capacity: {aq.remaining_capacity:.1f} Ah")
-    print(f"  Total Capacity:     {aq.total_capacity:.1f} Ah")
-    print(f"  Design Capacity:    {aq.design_capacity:.1f} Ah")
-    print(f"  Cycle Count:        {aq.cycle_number}")
-
-    print(f"\n  Cell Voltages ({aq.cell_count} cells):")
-    for i, v in enumerate(aq.cell_voltages):
-        print(f"    Cell {i + 1:2d}: {v:.3f} V")
-    if aq.cell_voltages:
-        vmin = min(aq.cell_voltages)
-        vmax = max(aq.cell_voltages)
-        print(f"    Delta:  {(vmax - vmin) * 1000:.1f} mV  (min={vmin:.3f}, max={vmax:.3f})")
-
-    print(f"\n  Temperatures ({aq.temperature_count} sensors):")
-    print(f"    MOS:    {aq.mos_temperature:.1f} C")
-    print(f"    PCB:    {aq.pcb_temperature:.1f} C")
-    for i, t in enumerate(aq.cell_temperatures):
-        print(f"    Cell {i + 1}: {t:.1f} C")
-
-    if aq.soh is not None:
-        print(f"\n  SOH:                {aq.soh}%")
-    if aq.cumulative_capacity is not None:
-        print(f"  Cumulative Cap:     {aq.cumulative_capacity:.1f} Ah")
-    if aq.remaining_time_min is not None:
-        hours = aq.remaining_time_min // 60
-        mins = aq.remaining_time_min % 60
-        print(f"  Remaining Time:     {hours}h {mins}m")
-    if aq.balance_current is not None:
-        print(f"  Balance Current:    {aq.balance_current:.1f} A")
-
-    print()
+    # Currents can be -0.0, which equals and hashes like 0.0 but prints
+    # with a sign, so they are keyed by their rendered text.
+    balance_current = aq.balance_current
+    sys.stdout.write(_format_battery_block((
+        aq.soc,
+        f"{aq.current:.1f}",
+        aq.module_voltage,
+        aq.remaining_capacity,
+        aq.total_capacity,
+        aq.design_capacity,
+        aq.cycle_number,
+        aq.cell_count,
+        tuple(aq.cell_voltages),
+        aq.temperature_count,
+        aq.mos_temperature,
+        aq.pcb_temperature,
+        tuple(aq.cell_temperatures),
+        aq.soh,
+        aq.cumulative_capacity,
+        aq.remaining_time_min,
+        None if balance_current is None else f"{balance_current:.1f}",
+    )))
+
+
+@functools.lru_cache(maxsize=4)
+def _format_battery_block(key: tuple) -> str:
+    """Render the battery status block for :func:`print_battery_data`.
+
+    ``key`` is an immutable snapshot of the displayed fields, so repeated
+    identical polls in ``loop`` reuse the already formatted text.
+    """
+    (
+        soc, current, module_voltage, remaining_capacity, total_capacity,
+        design_capacity, cycle_number, cell_count, cell_voltages,
+        temperature_count, mos_temperature, pcb_temperature,
+        cell_temperatures, soh, cumulative_capacity, remaining_time_min,
+        balance_current,
+    ) = key
+
+    lines = [
+        "",
+        "=" * 60,
+        "  BATTERY STATUS",
+        "=" * 60,
+    ]
+
+    lines.append(f"\n  SOC:                {soc}%")
+    lines.append(f"  Current:            {current} A")
+    lines.append(f"  Module Voltage:     {module_voltage:.2f} V")
+    lines.append(f"  Remaining Capacity: {remaining_capacity:.1f} Ah")
+    lines.append(f"  Total Capacity:     {total_capacity:.1f} Ah")
+    lines.append(f"  Design Capacity:    {design_capacity:.1f} Ah")
+    lines.append(f"  Cycle Count:        {cycle_number}")
+
+    lines.append(f"\n  Cell Voltages ({cell_count} cells):")
+    lines.extend(map(_CELL_VOLTAGE_FMT, itertools.count(1), cell_voltages))
+    if cell_voltages:
+        vmin = min(cell_voltages)
+        vmax = max(cell_voltages)
+        lines.append(f"    Delta:  {(vmax - vmin) * 1000:.1f} mV  (min={vmin:.3f}, max={vmax:.3f})")
+
+    lines.append(f"\n  Temperatures ({temperature_count} sensors):")
+    lines.append(f"    MOS:    {mos_temperature:.1f} C")
+    lines.append(f"    PCB:    {pcb_temperature:.1f} C")
+    lines.extend(map(_CELL_TEMPERATURE_FMT, itertools.count(1), cell_temperatures))
+
+    if soh is not None:
+        lines.append(f"\n  SOH:                {soh}%")
+    if cumulative_capacity is not None:
+        lines.append(f"  Cumulative Cap:     {cumulative_capacity:.1f} Ah")
+    if remaining_time_min is not None:
+        hours = remaining_time_min // 60
+        mins = remaining_time_min % 60
+        lines.append(f"  Remaining Time:     {hours}h {mins}m")
+    if balance_current is not None:
+        lines.append(f"  Balance Current:    {balance_current} A")
+
+    lines.append("")
+    return "\n".join(lines) + "\n"
+
+
+def print_product_info(pi: ProductInfo) -> None:
+    """Print product information to stdout."""
+    sys.stdout.write(
+        f"\n  Firmware:     {pi.firmware_version}\n"
+        f"  Manufacturer: {pi.manufacturer_name}\n"
+        f"  Serial:       {pi.serial_number}\n"
+    )
+
+
+def print_warning_info(wi: WarningInfo) -> None:
+    """Print active protections, faults, and warnings to stdout."""
+    protections = wi.protections
+    faults = wi.faults
+    warnings = wi.warnings
+    lines = []
+    if protections:
+        lines.append(f"  Protections:  {', '.join(protections)}")
+    if faults:
+        lines.append(f"  Faults:       {', '.join(faults)}")
+    if warnings:
+        lines.append(f"  Warnings:     {', '.join(warnings)}")
+    if not lines:
+        lines.append("  No active warnings or faults.")
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 async def cmd_scan(args: argparse.Namespace) -> None:
@@ -75,9 +149,7 @@ async def cmd_read(args: argparse.Namespace) -> None:
         # Product info
         pi = await client.read_product_info()
         if pi:
-            print(f"\n  Firmware:     {pi.firmware_version}")
-            print(f"  Manufacturer: {pi.manufacturer_name}")
-            print(f"  Serial:       {pi.serial_number}")
+            print_product_info(pi)
 
         # Battery data
         aq = await client.read_analog_quantity()
@@ -87,14 +159,7 @@ async def cmd_read(args: argparse.Namespace) -> None:
         # Warnings
         wi = await client.read_warning_info()
         if wi:
-            if wi.protections:
-                print(f"  Protections:  {', '.join(wi.protections)}")
-            if wi.faults:
-                print(f"  Faults:       {', '.join(wi.faults)}")
-            if wi.warnings:
-                print(f"  Warnings:     {', '.join(wi.warnings)}")
-            if not (wi.protections or wi.faults or wi.warnings):
-                print("  No active warnings or faults.")
+            print_warning_info(wi)
 
 
 async def cmd_loop(args: argparse.Namespace) -> None:
@@ -114,8 +179,24 @@ async def cmd_loop(args: argparse.Namespace) -> None:
             print("\nStopped.")
 
 
-def main() -> None:
-    """CLI entry point."""
+def _new_event_loop() -> asyncio.AbstractEventLoop:
+    """Create the CLI event loop, with eager task execution where available."""
+    loop = asyncio.new_event_loop()
+    eager_task_factory = getattr(asyncio, "eager_task_factory", None)  # 3.12+
+    if eager_task_factory is not None:
+        loop.set_task_factory(eager_task_factory)
+    return loop
+
+
+def _run(coro: Coroutine[Any, Any, None]) -> None:
+    """Run a subcommand coroutine to completion on a fresh event loop."""
+    with asyncio.Runner(loop_factory=_new_event_loop) as runner:
+        runner.run(coro)
+
+
+@functools.cache
+def _get_parser() -> argparse.ArgumentParser:
+    """Build the argument parser on first use; later calls reuse it."""
     parser = argparse.ArgumentParser(
         prog="wattcycle-ble",
         description="BLE client for XDZN/Wattcycle battery monitors",
@@ -146,6 +227,12 @@ def main() -> None:
         help="poll interval in seconds (default: 5)",
     )
 
+    return parser
+
+
+def main() -> None:
+    """CLI entry point."""
+    parser = _get_parser()
     args = parser.parse_args()
 
     logging.basicConfig(
@@ -154,11 +241,11 @@ def main() -> None:
     )
 
     if args.command == "scan":
-        asyncio.run(cmd_scan(args))
+        _run(cmd_scan(args))
     elif args.command == "loop":
-        asyncio.run(cmd_loop(args))
+        _run(cmd_loop(args))
     elif args.command == "read":
-        asyncio.run(cmd_read(args))
+        _run(cmd_read(args))
     else:
         parser.print_help()
         sys.exit(1)
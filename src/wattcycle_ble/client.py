@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import re
 
 from bleak import BleakClient, BleakScanner
 from bleak.backends.device import BLEDevice
@@ -30,10 +31,27 @@ from .protocol import (
     parse_frame,
     parse_product_info,
     parse_warning_info,
+    response_start_address,
 )
 
 logger = logging.getLogger(__name__)
 
+# Initial reassembly buffer capacity, comfortably above any known response
+# length. Grown on demand for larger frames and never shrunk.
+_RESPONSE_BUFFER_SIZE = 512
+
+_DEVICE_NAME_RE = re.compile("|".join(re.escape(p) for p in DEVICE_NAME_PREFIXES))
+
+# Frame head probes for detect_frame_head: each head with the timeouts of
+# its attempts. The device may drop a probe written before it has
+# processed the auth key, so the first probe is re-sent once after 1s.
+_HEAD_PROBES = ((FRAME_HEAD, (1.0, 2.5)), (FRAME_HEAD_ALT, (3.0,)))
+
+
+def _set_result_unless_done(fut: asyncio.Future[bool], result: bool) -> None:
+    if not fut.done():
+        fut.set_result(result)
+
 
 class WattcycleClient:
     """Async BLE client for XDZN/Wattcycle battery monitors.
@@ -41,6 +59,7 @@ class WattcycleClient:
     Supports use as an async context manager::
 
         async with WattcycleClient("C0:D6:3C:57:EF:2F") as client:
+            await client.detect_frame_head()
             data = await client.read_analog_quantity()
             print(data.soc)
 
@@ -51,9 +70,14 @@ class WattcycleClient:
     def __init__(self, address: str | BLEDevice):
         self._address = address
         self._client: BleakClient | None = None
-        self._response_buffer = bytearray()
-        self._response_event = asyncio.Event()
+        self._response_buffer = bytearray(_RESPONSE_BUFFER_SIZE)
+        self._response_view = memoryview(self._response_buffer)
+        self._write_pos = 0
+        self._response_future: asyncio.Future[bool] | None = None
+        self._lock = asyncio.Lock()
         self._expected_len: int | None = None
+        self._expected_address: int | None = None
+        self._expected_head: int | None = None
         self.frame_head: int = FRAME_HEAD
 
     async def __aenter__(self) -> WattcycleClient:
@@ -77,7 +101,7 @@ class WattcycleClient:
         devices = await BleakScanner.discover(timeout=timeout)
         matches = [
             d for d in devices
-            if d.name and any(d.name.startswith(p) for p in DEVICE_NAME_PREFIXES)
+            if d.name and _DEVICE_NAME_RE.match(d.name)
         ]
         for d in matches:
             logger.info("Found: %s (%s)", d.name, d.address)
@@ -85,16 +109,55 @@ class WattcycleClient:
 
     def _notification_handler(self, _sender: object, data: bytearray) -> None:
         """Handle incoming BLE notifications (packet reassembly)."""
-        self._response_buffer.extend(data)
-
-        if self._expected_len is None and len(self._response_buffer) >= 8:
-            self._expected_len = expected_response_length(bytes(self._response_buffer))
-
-        if self._expected_len and len(self._response_buffer) >= self._expected_len:
-            self._response_event.set()
+        pos = self._write_pos
+        if pos == 0 and data and data[0] not in (FRAME_HEAD, FRAME_HEAD_ALT):
+            logger.debug("Dropping stray notification starting 0x%02X", data[0])
+            return
+
+        end = pos + len(data)
+        if self._expected_len is not None:
+            end = min(end, self._expected_len)  # ignore bytes past the frame
+        if end > len(self._response_buffer):
+            self._grow_response_buffer(end)
+        self._response_view[pos:end] = data[:end - pos]
+        self._write_pos = end
+
+        if self._expected_len is None:
+            if end < 8:
+                return
+            self._expected_len = expected_response_length(self._response_buffer)
+            self._write_pos = min(end, self._expected_len)
+            if self._expected_len > len(self._response_buffer):
+                self._grow_response_buffer(self._expected_len)
+
+        if self._write_pos >= self._expected_len:
+            address = self._expected_address
+            if address is not None:
+                got = response_start_address(self._response_buffer)
+                head = self._response_buffer[0]
+                if got != address or head != self._expected_head:
+                    # A late reply to an earlier command; keep waiting for ours
+                    logger.debug(
+                        "Discarding response 0x%02X/DP %d, expected 0x%02X/DP %d",
+                        head, got, self._expected_head, address,
+                    )
+                    self._write_pos = 0
+                    self._expected_len = None
+                    return
+            if self._response_future is not None:
+                _set_result_unless_done(self._response_future, True)
+
+    def _grow_response_buffer(self, size: int) -> None:
+        """Enlarge the reassembly buffer; the new capacity is kept for reuse."""
+        self._response_view.release()
+        self._response_buffer.extend(bytes(size - len(self._response_buffer)))
+        self._response_view = memoryview(self._response_buffer)
 
     async def connect(self) -> None:
-        """Connect to the device, enable notifications, and authenticate."""
+        """Connect to the device, enable notifications, and authenticate.
+
+        Call :meth:`detect_frame_head` next, before any read.
+        """
         logger.info("Connecting to %s...", self._address)
         self._client = BleakClient(self._address)
         await self._client.connect()
@@ -105,7 +168,6 @@ class WattcycleClient:
 
         await self._client.write_gatt_char(AUTH_UUID, AUTH_KEY, response=False)
         logger.debug("Auth key sent")
-        await asyncio.sleep(0.5)
 
     async def disconnect(self) -> None:
         """Disconnect from the device."""
@@ -122,55 +184,107 @@ class WattcycleClient:
         """Whether the BLE connection is active."""
         return self._client is not None and self._client.is_connected
 
-    async def send_command(self, cmd: bytes, timeout: float = 5.0) -> bytes | None:
+    @property
+    def mtu_size(self) -> int:
+        """ATT MTU of the active connection as known to Bleak (23 if unknown).
+
+        On BlueZ this is only accurate after :meth:`get_mtu`.
+        """
+        if self._client is None:
+            return 23
+        return self._client.mtu_size
+
+    async def get_mtu(self) -> int:
+        """Query the negotiated ATT MTU of the active connection.
+
+        The MTU is negotiated by the OS stack. BlueZ only reports it once a
+        characteristic has been acquired, which costs an extra D-Bus round
+        trip, so this is done on demand rather than on connect.
+        """
+        if self._client is None:
+            return 23
+        acquire_mtu = getattr(self._client._backend, "_acquire_mtu", None)
+        if acquire_mtu is not None:
+            try:
+                await acquire_mtu()
+            except Exception:
+                logger.debug("Could not acquire MTU", exc_info=True)
+        return self._client.mtu_size
+
+    async def send_command(
+        self,
+        cmd: bytes,
+        timeout: float = 5.0,
+        start_address: int | None = None,
+    ) -> bytes | None:
         """Send a raw command and wait for the complete response.
 
+        Safe to call concurrently; commands are sent one at a time in the
+        order they were issued.
+
         Args:
             cmd: Complete frame bytes to send.
             timeout: Response timeout in seconds.
+            start_address: If given, only a response for this DP, with the
+                same header byte as ``cmd``, is accepted; late replies to
+                earlier commands are discarded.
 
         Returns:
             Complete response bytes, or ``None`` on timeout.
         """
-        self._response_buffer.clear()
-        self._response_event.clear()
-        self._expected_len = None
-
-        logger.debug("TX: %s", format_hex(cmd))
-        await self._client.write_gatt_char(WRITE_UUID, cmd, response=False)
-
-        try:
-            await asyncio.wait_for(self._response_event.wait(), timeout=timeout)
-        except asyncio.TimeoutError:
-            if self._response_buffer:
-                logger.warning(
-                    "Timeout with partial data (%d bytes)", len(self._response_buffer)
-                )
-            else:
-                logger.warning("Timeout: no response")
-            return None
-
-        response = bytes(self._response_buffer)
-        logger.debug("RX: %s", format_hex(response))
-        return response
+        async with self._lock:
+            self._write_pos = 0
+            self._expected_len = None
+            self._expected_address = start_address
+            self._expected_head = cmd[0]
+            loop = asyncio.get_running_loop()
+            fut = self._response_future = loop.create_future()
+
+            debug = logger.isEnabledFor(logging.DEBUG)
+            if debug:
+                logger.debug("TX: %s", format_hex(cmd))
+            await self._client.write_gatt_char(WRITE_UUID, cmd, response=False)
+
+            # The notification handler resolves the future with True once the
+            # frame is complete; this timer resolves it with False on timeout.
+            timer = loop.call_later(timeout, _set_result_unless_done, fut, False)
+            try:
+                complete = await fut
+            finally:
+                timer.cancel()
+
+            if not complete:
+                if self._write_pos:
+                    logger.warning("Timeout with partial data (%d bytes)", self._write_pos)
+                else:
+                    logger.warning("Timeout: no response")
+                return None
+
+            response = bytes(self._response_view[:self._write_pos])
+            if debug:
+                logger.debug("RX: %s", format_hex(response))
+            return response
 
     async def detect_frame_head(self) -> bool:
         """Auto-detect the frame header byte (``0x7E`` or ``0x1E``).
 
-        Sends a product info read with each header and uses whichever
-        gets a valid response. Must be called after :meth:`connect`.
+        Sends a product info read with each header in turn and uses the
+        first one that gets a valid response. Must be called after
+        :meth:`connect` and before the first read: it also gives the
+        device time to accept the auth key.
 
         Returns:
             ``True`` if a working frame header was found.
         """
-        for head in [FRAME_HEAD, FRAME_HEAD_ALT]:
+        for head, timeouts in _HEAD_PROBES:
             cmd = build_read_frame(DP_PRODUCT_INFO, frame_head=head)
-            logger.debug("Trying frame head 0x%02X...", head)
-            resp = await self.send_command(cmd, timeout=3.0)
-            if resp and len(resp) >= MIN_FRAME_SIZE and resp[-1] == FRAME_TAIL:
-                self.frame_head = head
-                logger.info("Frame head detected: 0x%02X", head)
-                return True
+            for timeout in timeouts:
+                logger.debug("Trying frame head 0x%02X...", head)
+                resp = await self.send_command(cmd, timeout=timeout, start_address=DP_PRODUCT_INFO)
+                if resp and len(resp) >= MIN_FRAME_SIZE and resp[-1] == FRAME_TAIL:
+                    self.frame_head = head
+                    logger.info("Frame head detected: 0x%02X", head)
+                    return True
         logger.error("Failed to detect frame head")
         return False
 
@@ -182,7 +296,7 @@ class WattcycleClient:
             current, SOC, capacity, etc. ``None`` on failure.
         """
         cmd = build_read_frame(DP_ANALOG_QUANTITY, frame_head=self.frame_head)
-        resp = await self.send_command(cmd)
+        resp = await self.send_command(cmd, start_address=DP_ANALOG_QUANTITY)
         if not resp:
             return None
         frame = parse_frame(resp)
@@ -198,7 +312,7 @@ class WattcycleClient:
             and serial number. ``None`` on failure.
         """
         cmd = build_read_frame(DP_PRODUCT_INFO, frame_head=self.frame_head)
-        resp = await self.send_command(cmd)
+        resp = await self.send_command(cmd, start_address=DP_PRODUCT_INFO)
         if not resp:
             return None
         frame = parse_frame(resp)
@@ -214,7 +328,7 @@ class WattcycleClient:
             and balance states. ``None`` on failure.
         """
         cmd = build_read_frame(DP_WARNING_INFO, frame_head=self.frame_head)
-        resp = await self.send_command(cmd)
+        resp = await self.send_command(cmd, start_address=DP_WARNING_INFO)
         if not resp:
             return None
         frame = parse_frame(resp)
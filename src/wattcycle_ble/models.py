@@ -2,10 +2,58 @@
 
 from __future__ import annotations
 
+from array import array
 from dataclasses import dataclass, field
 
 
-@dataclass
+# --- Status/warning register bit tables: (mask, flag name) ---
+_STATUS_1_FLAGS = (
+    (0x01, "cell_overcharge"),
+    (0x02, "cell_overdischarge"),
+    (0x04, "total_overcharge"),
+    (0x08, "total_overdischarge"),
+    (0x10, "charge_overcurrent"),
+    (0x20, "discharge_overcurrent"),
+    (0x40, "hardware"),
+    (0x80, "charge_voltage_high"),
+)
+
+_STATUS_2_FLAGS = (
+    (0x01, "charge_high_temp"),
+    (0x02, "discharge_high_temp"),
+    (0x04, "charge_low_temp"),
+    (0x08, "discharge_low_temp"),
+    (0x10, "mos_high_temp"),
+    (0x20, "env_high_temp"),
+    (0x40, "env_low_temp"),
+)
+
+_STATUS_5_FLAGS = (
+    (0x01, "cell"),
+    (0x02, "charge_mos"),
+    (0x04, "discharge_mos"),
+    (0x08, "temperature"),
+)
+
+_WARNING_1_FLAGS = _STATUS_1_FLAGS
+
+_WARNING_2_FLAGS = (
+    (0x01, "charge_high_temp"),
+    (0x02, "discharge_high_temp"),
+    (0x04, "charge_low_temp"),
+    (0x08, "discharge_low_temp"),
+    (0x10, "env_high_temp"),
+    (0x20, "env_low_temp"),
+    (0x40, "mos_high_temp"),
+)
+
+
+def _decode_flags(*registers: tuple[int, tuple[tuple[int, str], ...]]) -> list[str]:
+    """Names of the set bits in each ``(register_value, flag_table)`` pair."""
+    return [name for value, table in registers for mask, name in table if value & mask]
+
+
+@dataclass(slots=True)
 class WattFrame:
     """Parsed response frame."""
 
@@ -15,22 +63,23 @@ class WattFrame:
     start_address: int
     data_length: int
     data: bytes
-    raw: bytes
 
 
-@dataclass
+@dataclass(slots=True)
 class AnalogQuantity:
     """Battery analog data (DP 140 / 0x8C).
 
     Contains cell voltages, temperatures, current, capacity, and SOC.
+    Cell voltages and cell temperatures are stored as packed ``array("d")``
+    values rather than lists of boxed floats.
     """
 
     cell_count: int = 0
-    cell_voltages: list[float] = field(default_factory=list)
+    cell_voltages: array = field(default_factory=lambda: array("d"))
     temperature_count: int = 0
     mos_temperature: float = 0.0
     pcb_temperature: float = 0.0
-    cell_temperatures: list[float] = field(default_factory=list)
+    cell_temperatures: array = field(default_factory=lambda: array("d"))
     current: float = 0.0
     module_voltage: float = 0.0
     remaining_capacity: float = 0.0
@@ -45,7 +94,7 @@ class AnalogQuantity:
     balance_current: float | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ProductInfo:
     """Product information (DP 146 / 0x92)."""
 
@@ -54,7 +103,7 @@ class ProductInfo:
     serial_number: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class WarningInfo:
     """Warning and status information (DP 141 / 0x8D).
 
@@ -82,90 +131,20 @@ class WarningInfo:
     @property
     def protections(self) -> list[str]:
         """Active protection flags as human-readable strings."""
-        flags = []
-        r1 = self.status_register_1
-        if r1 & 0x01:
-            flags.append("cell_overcharge")
-        if r1 & 0x02:
-            flags.append("cell_overdischarge")
-        if r1 & 0x04:
-            flags.append("total_overcharge")
-        if r1 & 0x08:
-            flags.append("total_overdischarge")
-        if r1 & 0x10:
-            flags.append("charge_overcurrent")
-        if r1 & 0x20:
-            flags.append("discharge_overcurrent")
-        if r1 & 0x40:
-            flags.append("hardware")
-        if r1 & 0x80:
-            flags.append("charge_voltage_high")
-        r2 = self.status_register_2
-        if r2 & 0x01:
-            flags.append("charge_high_temp")
-        if r2 & 0x02:
-            flags.append("discharge_high_temp")
-        if r2 & 0x04:
-            flags.append("charge_low_temp")
-        if r2 & 0x08:
-            flags.append("discharge_low_temp")
-        if r2 & 0x10:
-            flags.append("mos_high_temp")
-        if r2 & 0x20:
-            flags.append("env_high_temp")
-        if r2 & 0x40:
-            flags.append("env_low_temp")
-        return flags
+        return _decode_flags(
+            (self.status_register_1, _STATUS_1_FLAGS),
+            (self.status_register_2, _STATUS_2_FLAGS),
+        )
 
     @property
     def faults(self) -> list[str]:
         """Active fault flags as human-readable strings."""
-        flags = []
-        r5 = self.status_register_5
-        if r5 & 0x01:
-            flags.append("cell")
-        if r5 & 0x02:
-            flags.append("charge_mos")
-        if r5 & 0x04:
-            flags.append("discharge_mos")
-        if r5 & 0x08:
-            flags.append("temperature")
-        return flags
+        return _decode_flags((self.status_register_5, _STATUS_5_FLAGS))
 
     @property
     def warnings(self) -> list[str]:
         """Active warning flags as human-readable strings."""
-        flags = []
-        w1 = self.warning_register_1
-        if w1 & 0x01:
-            flags.append("cell_overcharge")
-        if w1 & 0x02:
-            flags.append("cell_overdischarge")
-        if w1 & 0x04:
-            flags.append("total_overcharge")
-        if w1 & 0x08:
-            flags.append("total_overdischarge")
-        if w1 & 0x10:
-            flags.append("charge_overcurrent")
-        if w1 & 0x20:
-            flags.append("discharge_overcurrent")
-        if w1 & 0x40:
-            flags.append("hardware")
-        if w1 & 0x80:
-            flags.append("charge_voltage_high")
-        w2 = self.warning_register_2
-        if w2 & 0x01:
-            flags.append("charge_high_temp")
-        if w2 & 0x02:
-            flags.append("discharge_high_temp")
-        if w2 & 0x04:
-            flags.append("charge_low_temp")
-        if w2 & 0x08:
-            flags.append("discharge_low_temp")
-        if w2 & 0x10:
-            flags.append("env_high_temp")
-        if w2 & 0x20:
-            flags.append("env_low_temp")
-        if w2 & 0x40:
-            flags.append("mos_high_temp")
-        return flags
+        return _decode_flags(
+            (self.warning_register_1, _WARNING_1_FLAGS),
+            (self.warning_register_2, _WARNING_2_FLAGS),
+        )
@@ -0,0 +1,14 @@
+"""Tests for the wattcycle_ble command-line output."""
+
+from wattcycle_ble.cli import print_battery_data
+from wattcycle_ble.models import AnalogQuantity
+
+
+class TestPrintBatteryData:
+    def test_signed_zero_current_not_cached(self, capsys):
+        print_battery_data(AnalogQuantity(current=0.0, balance_current=0.0))
+        print_battery_data(AnalogQuantity(current=-0.0, balance_current=-0.0))
+        first, second = capsys.readouterr().out.split("=" * 60 + "\n  BATTERY STATUS")[1:]
+        assert "Current:            0.0 A" in first
+        assert "Current:            -0.0 A" in second
+        assert "Balance Current:    -0.0 A" in second
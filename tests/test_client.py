@@ -0,0 +1,235 @@
+"""Tests for the wattcycle_ble client's response handling.
+
+Drives :class:`WattcycleClient` with a stub in place of the Bleak client,
+feeding notifications straight into the reassembly handler.
+"""
+
+import asyncio
+import logging
+
+from wattcycle_ble import client as client_module
+from wattcycle_ble.client import WattcycleClient
+from wattcycle_ble.protocol import (
+    DP_ANALOG_QUANTITY,
+    DP_PRODUCT_INFO,
+    DP_WARNING_INFO,
+    FRAME_HEAD,
+    FRAME_HEAD_ALT,
+    FRAME_TAIL,
+    build_read_frame,
+    modbus_crc16,
+)
+
+from .test_protocol import (
+    SAMPLE_ANALOG_RESPONSE,
+    SAMPLE_PRODUCT_RESPONSE,
+    SAMPLE_WARNING_RESPONSE,
+)
+
+RESPONSES = {
+    DP_ANALOG_QUANTITY: SAMPLE_ANALOG_RESPONSE,
+    DP_PRODUCT_INFO: SAMPLE_PRODUCT_RESPONSE,
+    DP_WARNING_INFO: SAMPLE_WARNING_RESPONSE,
+}
+
+
+def make_response(dp: int, payload: bytes, head: int = FRAME_HEAD) -> bytes:
+    """Build a valid response frame carrying ``payload``."""
+    body = bytes([head, 0x00, 0x01, 0x03]) + dp.to_bytes(2, "big")
+    body += len(payload).to_bytes(2, "big") + payload
+    return body + modbus_crc16(body).to_bytes(2, "big") + bytes([FRAME_TAIL])
+
+
+class StubBleak:
+    """Stands in for ``BleakClient``: records writes and replies on demand.
+
+    ``replies`` maps a written command to the list of notification
+    fragments to deliver in response (none if the command is missing),
+    ``delay`` seconds after the write.
+    """
+
+    def __init__(
+        self,
+        client: WattcycleClient,
+        replies: dict[bytes, list[bytes]],
+        delay: float = 0.0,
+    ):
+        self._client = client
+        self._replies = replies
+        self._delay = delay
+        self.written: list[bytes] = []
+
+    async def write_gatt_char(self, _uuid: str, data: bytes, response: bool = False) -> None:
+        self.written.append(bytes(data))
+        fragments = self._replies.get(bytes(data), ())
+        loop = asyncio.get_running_loop()
+        if self._delay:
+            loop.call_later(self._delay, self._deliver, fragments)
+        else:
+            self._deliver(fragments)
+
+    def _deliver(self, fragments: list[bytes]) -> None:
+        loop = asyncio.get_running_loop()
+        for fragment in fragments:
+            loop.call_soon(self._client._notification_handler, None, bytearray(fragment))
+
+
+def split(data: bytes, *sizes: int) -> list[bytes]:
+    """Split ``data`` into fragments of the given sizes plus the remainder."""
+    parts = []
+    for size in sizes:
+        parts.append(data[:size])
+        data = data[size:]
+    if data:
+        parts.append(data)
+    return parts
+
+
+def exchange(replies: dict[bytes, list[bytes]], cmd: bytes, **kwargs) -> bytes | None:
+    """Send ``cmd`` through a stubbed client and return the response."""
+    async def run():
+        client = WattcycleClient("AA:BB:CC:DD:EE:FF")
+        client._client = StubBleak(client, replies)
+        return await client.send_command(cmd, **kwargs)
+
+    return asyncio.run(run())
+
+
+CMD = build_read_frame(DP_ANALOG_QUANTITY)
+
+
+class TestReassembly:
+    def test_single_notification(self):
+        resp = exchange({CMD: [SAMPLE_ANALOG_RESPONSE]}, CMD)
+        assert resp == SAMPLE_ANALOG_RESPONSE
+
+    def test_fragmented_short_first_fragment(self):
+        # The first fragment is too short to carry DATA_LEN
+        fragments = split(SAMPLE_ANALOG_RESPONSE, 3, 5, 20)
+        resp = exchange({CMD: fragments}, CMD)
+        assert resp == SAMPLE_ANALOG_RESPONSE
+
+    def test_trailing_bytes_ignored(self):
+        fragments = split(SAMPLE_ANALOG_RESPONSE + b"\xAA\xBB\xCC", 20)
+        resp = exchange({CMD: fragments}, CMD)
+        assert resp == SAMPLE_ANALOG_RESPONSE
+
+    def test_large_frame_grows_buffer(self):
+        big = make_response(DP_ANALOG_QUANTITY, bytes(range(256)) * 3)
+        assert len(big) > 512
+        fragments = [big[i:i + 244] for i in range(0, len(big), 244)]
+        resp = exchange({CMD: fragments}, CMD)
+        assert resp == big
+
+    def test_stray_first_fragment_dropped(self):
+        resp = exchange({CMD: [b"\x00\x01\x02", SAMPLE_ANALOG_RESPONSE]}, CMD)
+        assert resp == SAMPLE_ANALOG_RESPONSE
+
+    def test_stale_response_discarded(self):
+        fragments = [SAMPLE_PRODUCT_RESPONSE, SAMPLE_ANALOG_RESPONSE]
+        resp = exchange({CMD: fragments}, CMD, start_address=DP_ANALOG_QUANTITY)
+        assert resp == SAMPLE_ANALOG_RESPONSE
+
+
+class TestSendCommand:
+    def test_timeout_no_response(self, caplog):
+        with caplog.at_level(logging.WARNING):
+            assert exchange({}, CMD, timeout=0.05) is None
+        assert "no response" in caplog.text
+
+    def test_timeout_with_partial_data(self, caplog):
+        partial = SAMPLE_ANALOG_RESPONSE[:20]
+        with caplog.at_level(logging.WARNING):
+            assert exchange({CMD: [partial]}, CMD, timeout=0.05) is None
+        assert "partial data (20 bytes)" in caplog.text
+
+    def test_concurrent_commands_fifo(self):
+        cmds = [build_read_frame(dp) for dp in RESPONSES]
+        replies = {cmd: [RESPONSES[dp]] for cmd, dp in zip(cmds, RESPONSES)}
+
+        async def run():
+            client = WattcycleClient("AA:BB:CC:DD:EE:FF")
+            stub = client._client = StubBleak(client, replies)
+            results = await asyncio.gather(*(client.send_command(c) for c in cmds))
+            return stub.written, results
+
+        written, results = asyncio.run(run())
+        assert written == cmds
+        assert results == list(RESPONSES.values())
+
+
+
+class TestGetMtu:
+    def test_not_connected(self):
+        assert asyncio.run(WattcycleClient("AA:BB:CC:DD:EE:FF").get_mtu()) == 23
+
+    def test_acquires_on_demand(self):
+        class Backend:
+            async def _acquire_mtu(self):
+                stub.mtu_size = 247
+
+        async def run():
+            client = WattcycleClient("AA:BB:CC:DD:EE:FF")
+            client._client = stub
+            return await client.get_mtu()
+
+        stub = StubBleak(None, {})
+        stub._backend = Backend()
+        stub.mtu_size = 23
+        assert asyncio.run(run()) == 247
+
+PROBE = build_read_frame(DP_PRODUCT_INFO, frame_head=FRAME_HEAD)
+PROBE_ALT = build_read_frame(DP_PRODUCT_INFO, frame_head=FRAME_HEAD_ALT)
+PRODUCT_ALT = make_response(DP_PRODUCT_INFO, SAMPLE_PRODUCT_RESPONSE[8:-3], head=FRAME_HEAD_ALT)
+
+
+class DropFirstWrite(StubBleak):
+    """Ignores the first write, like a device still processing the auth key."""
+
+    async def write_gatt_char(self, _uuid: str, data: bytes, response: bool = False) -> None:
+        if not self.written:
+            self.written.append(bytes(data))
+            return
+        await super().write_gatt_char(_uuid, data, response)
+
+
+class TestDetectFrameHead:
+    @staticmethod
+    def detect(monkeypatch, replies, delay=0.0, stub_cls=StubBleak):
+        monkeypatch.setattr(
+            client_module, "_HEAD_PROBES",
+            ((FRAME_HEAD, (0.05, 0.05)), (FRAME_HEAD_ALT, (0.3,))),
+        )
+
+        async def run():
+            client = WattcycleClient("AA:BB:CC:DD:EE:FF")
+            stub = client._client = stub_cls(client, replies, delay)
+            detected = await client.detect_frame_head()
+            return detected, client.frame_head, stub.written
+
+        return asyncio.run(run())
+
+    def test_default_head(self, monkeypatch):
+        detected, head, written = self.detect(monkeypatch, {PROBE: [SAMPLE_PRODUCT_RESPONSE]})
+        assert detected and head == FRAME_HEAD
+        assert written == [PROBE]
+
+    def test_alt_head(self, monkeypatch):
+        detected, head, written = self.detect(monkeypatch, {PROBE_ALT: [PRODUCT_ALT]})
+        assert detected and head == FRAME_HEAD_ALT
+        assert written == [PROBE, PROBE, PROBE_ALT]
+
+    def test_first_probe_resent(self, monkeypatch):
+        detected, head, written = self.detect(
+            monkeypatch, {PROBE: [SAMPLE_PRODUCT_RESPONSE]}, stub_cls=DropFirstWrite,
+        )
+        assert detected and head == FRAME_HEAD
+        assert written == [PROBE, PROBE]
+
+    def test_late_reply_not_taken_for_alt_head(self, monkeypatch):
+        # The 0x7E replies only arrive during the 0x1E probe's window
+        detected, head, _ = self.detect(
+            monkeypatch, {PROBE: [SAMPLE_PRODUCT_RESPONSE]}, delay=0.15,
+        )
+        assert not detected
+        assert head == FRAME_HEAD
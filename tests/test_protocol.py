@@ -4,12 +4,17 @@ Uses real captured data from a Wattcycle XDZN device to validate
 CRC calculation, frame building, and response parsing.
 """
 
+import typing
+from array import array
+
+from wattcycle_ble.models import AnalogQuantity, WarningInfo
 from wattcycle_ble.protocol import (
     DP_ANALOG_QUANTITY,
     DP_PRODUCT_INFO,
     DP_WARNING_INFO,
     build_read_frame,
     modbus_crc16,
+    modbus_crc16_bulk,
     parse_analog_quantity,
     parse_frame,
     parse_product_info,
@@ -74,6 +79,13 @@ class TestModbusCRC:
         result = modbus_crc16(b"")
         assert isinstance(result, int)
 
+    def test_bulk_matches(self):
+        """The two-bytes-per-step variant agrees, for odd and even lengths."""
+        log = SAMPLE_ANALOG_RESPONSE + SAMPLE_PRODUCT_RESPONSE + SAMPLE_WARNING_RESPONSE
+        for n in (0, 1, 2, 10, 11, len(log) - 1, len(log)):
+            assert modbus_crc16_bulk(log[:n]) == modbus_crc16(log[:n])
+        assert modbus_crc16_bulk(bytearray(log)) == modbus_crc16(log)
+
 
 class TestBuildReadFrame:
     def test_analog_quantity_frame(self):
@@ -235,12 +247,29 @@ class TestParseAnalogQuantity:
         assert abs(aq.design_capacity - 314.0) < 0.1
         assert aq.soc == 58
 
+    def test_cell_values_are_arrays(self):
+        aq = parse_analog_quantity(parse_frame(SAMPLE_ANALOG_RESPONSE).data)
+        assert isinstance(aq.cell_voltages, array)
+        assert isinstance(aq.cell_temperatures, array)
+        assert aq.cell_voltages.typecode == aq.cell_temperatures.typecode == "d"
+
+    def test_type_hints_resolve(self):
+        hints = typing.get_type_hints(AnalogQuantity)
+        assert hints["cell_voltages"] is hints["cell_temperatures"] is array
+
     def test_empty_data(self):
         assert parse_analog_quantity(b"") is None
 
     def test_truncated(self):
         assert parse_analog_quantity(b"\x04") is None
 
+    def test_every_truncation_rejected(self):
+        data = parse_frame(SAMPLE_ANALOG_RESPONSE).data
+        # 4 cells, 4 temperature sensors: 32 bytes before the extension
+        for cut in range(32):
+            assert parse_analog_quantity(data[:cut]) is None
+        assert parse_analog_quantity(data[:32]) is not None
+
 
 class TestParseProductInfo:
     def test_real_data(self):
@@ -270,3 +299,32 @@ class TestParseWarningInfo:
 
     def test_empty_data(self):
         assert parse_warning_info(b"") is None
+
+    def test_flag_names(self):
+        wi = WarningInfo(
+            status_register_1=0x81,
+            status_register_2=0x10,
+            status_register_5=0x0A,
+            warning_register_1=0x02,
+            warning_register_2=0x50,
+        )
+        assert wi.protections == ["cell_overcharge", "charge_voltage_high", "mos_high_temp"]
+        assert wi.faults == ["charge_mos", "temperature"]
+        assert wi.warnings == ["cell_overdischarge", "env_high_temp", "mos_high_temp"]
+
+    def test_balance_states_multi_byte(self):
+        data = bytes([9] + [0] * 9 + [2, 0, 0] + [0] * 13 + [0x05, 0x01])
+        wi = parse_warning_info(data)
+        assert wi is not None
+        assert wi.balance_states == [
+            True, False, True, False, False, False, False, False, True,
+        ]
+
+    def test_truncated_balance_states(self):
+        data = bytes([9] + [0] * 9 + [2, 0, 0] + [0] * 13 + [0x05])
+        assert parse_warning_info(data) is None
+
+    def test_every_truncation_rejected(self):
+        data = parse_frame(SAMPLE_WARNING_RESPONSE).data
+        for cut in range(len(data)):
+            assert parse_warning_info(data[:cut]) is None